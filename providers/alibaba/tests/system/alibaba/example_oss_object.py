@@ -38,7 +38,7 @@ with DAG(
     dag_id=DAG_ID,
     start_date=datetime(2021, 1, 1),
     schedule=None,
-    default_args={"bucket_name": "your bucket", "region": "your region"},
+    default_args={"bucket_name": "your bucket", "region": REGION},
     max_active_runs=1,
     tags=["example"],
     catchup=False,
@@ -47,26 +47,22 @@ with DAG(
         file="your local file",
         key="your oss key",
         task_id="task1",
-        region=REGION,
     )
 
     download_object = OSSDownloadObjectOperator(
         file="your local file",
         key="your oss key",
         task_id="task2",
-        region=REGION,
     )
 
     delete_object = OSSDeleteObjectOperator(
         key="your oss key",
         task_id="task3",
-        region=REGION,
     )
 
     delete_batch_object = OSSDeleteBatchObjectOperator(
         keys=["obj1", "obj2", "obj3"],
         task_id="task4",
-        region=REGION,
     )
 
     create_object >> download_object >> delete_object >> delete_batch_object
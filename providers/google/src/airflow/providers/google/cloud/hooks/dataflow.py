@@ -74,6 +74,8 @@ JOB_ID_PATTERN = re.compile(
     r"Submitted job: (?P<job_id_java>[^\"\n\s]*)|Created job with id: \[(?P<job_id_python>[^\"\n\s]*)\]"
 )
 
+JOB_NAME_PATTERN = re.compile(r"[a-z]([-a-z0-9]*[a-z0-9])?")
+
 T = TypeVar("T", bound=Callable)
 
 
@@ -93,6 +95,9 @@ def process_line_and_extract_dataflow_job_id_callback(
         # Job id info: https://goo.gl/SE29y9.
         if on_new_job_id_callback is None:
             return
+        # Both "Submitted job: " and "Created job with id: " contain " job", so most lines can skip the regex.
+        if " job" not in line:
+            return
         matched_job = JOB_ID_PATTERN.search(line)
         if matched_job is None:
             return
@@ -1033,7 +1038,7 @@ class DataflowHook(GoogleBaseHook):
         """Build Dataflow job name."""
         base_job_name = str(job_name).replace("_", "-")
 
-        if not re.fullmatch(r"[a-z]([-a-z0-9]*[a-z0-9])?", base_job_name):
+        if not JOB_NAME_PATTERN.fullmatch(base_job_name):
             raise ValueError(
                 f"Invalid job_name ({base_job_name}); the name must consist of only the characters "
                 f"[-a-z0-9], starting with a letter and ending with a letter or number "
@@ -1407,19 +1412,26 @@ class AsyncDataflowHook(GoogleBaseAsyncHook, DataflowJobTerminalStateHelper):
 
     sync_hook_class = DataflowHook
 
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._clients: dict[type, Any] = {}
+
     async def initialize_client(self, client_class):
         """
         Initialize object of the given class.
 
         Method is used to initialize asynchronous client. Because of the big amount of the classes which are
         used for Dataflow service it was decided to initialize them the same way with credentials which are
-        received from the method of the GoogleBaseHook class.
+        received from the method of the GoogleBaseHook class. Each client is created once per hook and
+        reused by subsequent calls.
         :param client_class: Class of the Google cloud SDK
         """
-        credentials = (await self.get_sync_hook()).get_credentials()
-        return client_class(
-            credentials=credentials,
-        )
+        if client_class not in self._clients:
+            credentials = (await self.get_sync_hook()).get_credentials()
+            self._clients[client_class] = client_class(
+                credentials=credentials,
+            )
+        return self._clients[client_class]
 
     async def get_project_id(self) -> str:
         project_id = (await self.get_sync_hook()).project_id
@@ -18,13 +18,15 @@
 from __future__ import annotations
 
 import copy
+import functools
+import io
 import logging
 import re
-import shlex
 import subprocess
 from asyncio import Future
+from types import MappingProxyType
 from unittest import mock
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, Mock
 from uuid import UUID
 
 import pytest
@@ -49,12 +51,15 @@ from airflow.providers.google.cloud.hooks.dataflow import (
     AsyncDataflowHook,
     DataflowHook,
     DataflowJobStatus,
+    DataflowJobTerminalStateHelper,
     DataflowJobType,
     _DataflowJobsController,
     _fallback_to_project_id_from_variables,
     process_line_and_extract_dataflow_job_id_callback,
 )
 
+from unit.google.cloud.utils.base_gcp_mock import mock_base_gcp_hook_default_project_id
+
 JOB_NAME = "test-dataflow-pipeline"
 MOCK_UUID = UUID("cf4a56d2-8101-4217-b027-2af6216feb48")
 MOCK_UUID_PREFIX = str(MOCK_UUID)[:8]
@@ -64,26 +69,35 @@ PARAMETERS = {
     "inputFile": "gs://dataflow-samples/shakespeare/kinglear.txt",
     "output": "gs://test/output/my_output",
 }
-RUNTIME_ENV = {
-    "additionalExperiments": ["exp_flag1", "exp_flag2"],
-    "additionalUserLabels": {"name": "wrench", "mass": "1.3kg", "count": "3"},
-    "bypassTempDirValidation": {},
-    "ipConfiguration": "WORKER_IP_PRIVATE",
-    "kmsKeyName": (
-        "projects/TEST_PROJECT_ID/locations/TEST_LOCATIONS/keyRings/TEST_KEYRING/cryptoKeys/TEST_CRYPTOKEYS"
-    ),
-    "maxWorkers": 10,
-    "network": "default",
-    "numWorkers": 2,
-    "serviceAccountEmail": "test@apache.airflow",
-    "subnetwork": "regions/REGION/subnetworks/SUBNETWORK",
-    "tempLocation": "gs://test/temp",
-    "workerRegion": "test-region",
-    "workerZone": "test-zone",
-    "zone": "us-central1-f",
-    "machineType": "n1-standard-1",
-}
+RUNTIME_ENV = MappingProxyType(
+    {
+        "additionalExperiments": ("exp_flag1", "exp_flag2"),
+        "additionalUserLabels": MappingProxyType({"name": "wrench", "mass": "1.3kg", "count": "3"}),
+        "bypassTempDirValidation": MappingProxyType({}),
+        "ipConfiguration": "WORKER_IP_PRIVATE",
+        "kmsKeyName": (
+            "projects/TEST_PROJECT_ID/locations/TEST_LOCATIONS/keyRings/TEST_KEYRING/cryptoKeys/TEST_CRYPTOKEYS"
+        ),
+        "maxWorkers": 10,
+        "network": "default",
+        "numWorkers": 2,
+        "serviceAccountEmail": "test@apache.airflow",
+        "subnetwork": "regions/REGION/subnetworks/SUBNETWORK",
+        "tempLocation": "gs://test/temp",
+        "workerRegion": "test-region",
+        "workerZone": "test-zone",
+        "zone": "us-central1-f",
+        "machineType": "n1-standard-1",
+    }
+)
 DATAFLOW_STRING = "airflow.providers.google.cloud.hooks.dataflow.{}"
+BASE_GOOGLE_HOOK_INIT = "airflow.providers.google.common.hooks.base_google.GoogleBaseHook.__init__"
+DATAFLOW_JOBS_CONTROLLER = DATAFLOW_STRING.format("_DataflowJobsController")
+DATAFLOW_UUID4 = DATAFLOW_STRING.format("uuid.uuid4")
+DATAFLOW_FETCH_JOB_MESSAGES_RESPONSES = DATAFLOW_STRING.format(
+    "_DataflowJobsController._fetch_list_job_messages_responses"
+)
+ASYNC_DATAFLOW_INITIALIZE_CLIENT = DATAFLOW_STRING.format("AsyncDataflowHook.initialize_client")
 TEST_PROJECT = "test-project"
 TEST_JOB_ID = "test-job-id"
 TEST_JOBS_FILTER = ListJobsRequest.Filter.ACTIVE
@@ -140,183 +154,268 @@ TEST_PIPELINE_BODY = {
 
 DEFAULT_CANCEL_TIMEOUT = 5 * 60
 
+_VALID_NAME_CASES = (
+    (JOB_NAME, JOB_NAME, False),
+    ("test-example", "test_example", False),
+    (f"test-dataflow-pipeline-{MOCK_UUID_PREFIX}", JOB_NAME, True),
+    (f"test-example-{MOCK_UUID_PREFIX}", "test_example", True),
+    ("df-job-1", "df-job-1", False),
+    ("df-job", "df-job", False),
+    ("dfjob", "dfjob", False),
+    ("dfjob1", "dfjob1", False),
+)
+_VALID_NAME_IDS = [f"{job_name}-append" if append else job_name for _, job_name, append in _VALID_NAME_CASES]
+_INVALID_JOB_NAMES = ("1dfjob@", "dfjob@", "df^jo")
+_INVALID_NAME_CASES = tuple(
+    (job_name, re.compile(rf"Invalid job_name \({re.escape(job_name)}\);")) for job_name in _INVALID_JOB_NAMES
+)
 
-class TestFallbackToVariables:
-    def test_support_project_id_parameter(self):
-        mock_instance = mock.MagicMock()
+# (job_type, job_state, wait_until_finished, expected) where expected is either the
+# job_reached_terminal_state result or the regex of the AirflowException it raises.
+_JOB_STATE_CASES = (
+    # RUNNING
+    (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_RUNNING, None, False),
+    (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_RUNNING, None, True),
+    (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_RUNNING, True, False),
+    (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_RUNNING, True, False),
+    (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_RUNNING, False, True),
+    (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_RUNNING, False, True),
+    # AWAITING STATE
+    (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_PENDING, None, False),
+    (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_PENDING, None, False),
+    (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_PENDING, True, False),
+    (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_PENDING, True, False),
+    (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_PENDING, False, True),
+    (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_PENDING, False, True),
+    # WITHOUT JOB TYPE
+    (None, DataflowJobStatus.JOB_STATE_DONE, None, True),
+    (None, DataflowJobStatus.JOB_STATE_DONE, True, True),
+    (None, DataflowJobStatus.JOB_STATE_DONE, False, True),
+    (None, DataflowJobStatus.JOB_STATE_RUNNING, None, False),
+    (None, DataflowJobStatus.JOB_STATE_RUNNING, True, False),
+    (None, DataflowJobStatus.JOB_STATE_RUNNING, False, True),
+    (None, DataflowJobStatus.JOB_STATE_PENDING, None, False),
+    (None, DataflowJobStatus.JOB_STATE_PENDING, True, False),
+    (None, DataflowJobStatus.JOB_STATE_PENDING, False, True),
+    # UNEXPECTED TERMINAL STATE
+    *(
+        (job_type, job_state, None, job_state)
+        for job_state in (
+            DataflowJobStatus.JOB_STATE_FAILED,
+            DataflowJobStatus.JOB_STATE_UNKNOWN,
+            DataflowJobStatus.JOB_STATE_CANCELLED,
+            DataflowJobStatus.JOB_STATE_DRAINED,
+            DataflowJobStatus.JOB_STATE_UPDATED,
+        )
+        for job_type in (DataflowJobType.JOB_TYPE_BATCH, DataflowJobType.JOB_TYPE_STREAMING)
+    ),
+)
+_JOB_STATE_IDS = [
+    f"{(job_type or 'NO_TYPE').removeprefix('JOB_TYPE_')}-{job_state.removeprefix('JOB_STATE_')}-{wait}"
+    for job_type, job_state, wait, _ in _JOB_STATE_CASES
+]
+
+# Jobs first reported without a type while awaiting, then with their final type and state.
+_AWAITING_WITHOUT_TYPE = (
+    (None, DataflowJobStatus.JOB_STATE_QUEUED),
+    (None, DataflowJobStatus.JOB_STATE_PENDING),
+)
+_JOB_STATE_SEQUENCE_CASES = (
+    # STREAMING
+    (
+        (*_AWAITING_WITHOUT_TYPE, (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_RUNNING)),
+        None,
+        True,
+    ),
+    (
+        (*_AWAITING_WITHOUT_TYPE, (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_RUNNING)),
+        True,
+        False,
+    ),
+    # BATCH
+    (
+        (*_AWAITING_WITHOUT_TYPE, (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_RUNNING)),
+        False,
+        True,
+    ),
+    (
+        (*_AWAITING_WITHOUT_TYPE, (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_RUNNING)),
+        None,
+        False,
+    ),
+    (
+        (*_AWAITING_WITHOUT_TYPE, (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_DONE)),
+        None,
+        True,
+    ),
+)
 
-        class FixtureFallback:
-            @_fallback_to_project_id_from_variables
-            def test_fn(self, *args, **kwargs):
-                mock_instance(*args, **kwargs)
+_WAIT_FOR_DONE_EXPECTED = MappingProxyType(
+    {
+        "project_number": TEST_PROJECT_ID,
+        "name": "JOB_NAME",
+        "location": TEST_LOCATION,
+        "poll_sleep": 10,
+        "job_id": TEST_JOB_ID,
+        "num_retries": 5,
+        "multiple_jobs": False,
+        "drain_pipeline": False,
+        "cancel_timeout": DEFAULT_CANCEL_TIMEOUT,
+        "wait_until_finished": None,
+    }
+)
 
-        FixtureFallback().test_fn(project_id="TEST")
 
-        mock_instance.assert_called_once_with(project_id="TEST")
+def _job(state: str, job_type: str | None = None, *, job_id: str = "id-2", name: str = "name-2") -> dict:
+    job = {"id": job_id, "name": name, "currentState": state}
+    if job_type is not None:
+        job["type"] = job_type
+    return job
 
-    def test_support_project_id_from_variable_parameter(self):
-        mock_instance = mock.MagicMock()
 
-        class FixtureFallback:
-            @_fallback_to_project_id_from_variables
-            def test_fn(self, *args, **kwargs):
-                mock_instance(*args, **kwargs)
+def _job_states(*states: str) -> list[dict]:
+    return [_job(state, job_id=TEST_JOB_ID, name=JOB_NAME) for state in states]
 
-        FixtureFallback().test_fn(variables={"project": "TEST"})
 
-        mock_instance.assert_called_once_with(project_id="TEST", variables={})
+def _cancel_job_calls(requested_state: str) -> list:
+    """Calls on the jobs resource made by a controller fetching and cancelling TEST_JOB_ID."""
+    return [
+        mock.call.get(jobId=TEST_JOB_ID, location=TEST_LOCATION, projectId=TEST_PROJECT),
+        mock.call.get().execute(num_retries=20),
+        mock.call.update(
+            body={"requestedState": requested_state},
+            jobId=TEST_JOB_ID,
+            location=TEST_LOCATION,
+            projectId=TEST_PROJECT,
+        ),
+        mock.call.update().execute(num_retries=20),
+    ]
 
-    def test_raise_exception_on_conflict(self):
-        mock_instance = mock.MagicMock()
 
-        class FixtureFallback:
-            @_fallback_to_project_id_from_variables
-            def test_fn(self, *args, **kwargs):
-                mock_instance(*args, **kwargs)
+@pytest.fixture(scope="module")
+def dataflow_hook_template():
+    with mock.patch(BASE_GOOGLE_HOOK_INIT, new=mock_base_gcp_hook_default_project_id):
+        return DataflowHook(gcp_conn_id="google_cloud_default")
 
-        with pytest.raises(
-            AirflowException,
-            match="The mutually exclusive parameter `project_id` and `project` key in `variables` parameter "
-            "are both present\\. Please remove one\\.",
-        ):
-            FixtureFallback().test_fn(variables={"project": "TEST"}, project_id="TEST2")
 
-    def test_raise_exception_on_positional_argument(self):
-        mock_instance = mock.MagicMock()
+@pytest.fixture
+def mock_uuid4():
+    with mock.patch(DATAFLOW_UUID4, return_value=MOCK_UUID) as mock_uuid:
+        yield mock_uuid
+
+
+class FixtureFallback:
+    @_fallback_to_project_id_from_variables
+    def test_fn(self, *args, **kwargs):
+        return args, kwargs
 
-        class FixtureFallback:
-            @_fallback_to_project_id_from_variables
-            def test_fn(self, *args, **kwargs):
-                mock_instance(*args, **kwargs)
 
-        with pytest.raises(
-            AirflowException, match="You must use keyword arguments in this methods rather than positional"
-        ):
-            FixtureFallback().test_fn({"project": "TEST"}, "TEST2")
+class TestFallbackToVariables:
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_kwargs"),
+        [
+            pytest.param({"project_id": "TEST"}, {"project_id": "TEST"}, id="project_id"),
+            pytest.param(
+                {"variables": {"project": "TEST"}},
+                {"project_id": "TEST", "variables": {}},
+                id="project-from-variables",
+            ),
+        ],
+    )
+    def test_support_project_id(self, kwargs, expected_kwargs):
+        assert FixtureFallback().test_fn(**kwargs) == ((), expected_kwargs)
+
+    @pytest.mark.parametrize(
+        ("args", "kwargs", "match"),
+        [
+            pytest.param(
+                (),
+                {"variables": {"project": "TEST"}, "project_id": "TEST2"},
+                "The mutually exclusive parameter `project_id` and `project` key in `variables` parameter "
+                "are both present\\. Please remove one\\.",
+                id="conflict",
+            ),
+            pytest.param(
+                ({"project": "TEST"}, "TEST2"),
+                {},
+                "You must use keyword arguments in this methods rather than positional",
+                id="positional-argument",
+            ),
+        ],
+    )
+    def test_raise_exception(self, args, kwargs, match):
+        with pytest.raises(AirflowException, match=match):
+            FixtureFallback().test_fn(*args, **kwargs)
 
 
-@pytest.mark.db_test
 class TestDataflowHook:
-    def setup_method(self):
-        self.dataflow_hook = DataflowHook(gcp_conn_id="google_cloud_default")
-        self.dataflow_hook.beam_hook = MagicMock()
+    @pytest.fixture(autouse=True)
+    def setup_hook(self, dataflow_hook_template):
+        self.dataflow_hook = copy.copy(dataflow_hook_template)
+        self.mock_conn = self.dataflow_hook.get_conn = Mock()
+        self.dataflow_hook.beam_hook = Mock()
 
     @mock.patch("airflow.providers.google.cloud.hooks.dataflow.DataflowHook._authorize")
     @mock.patch("airflow.providers.google.cloud.hooks.dataflow.build")
-    def test_dataflow_client_creation(self, mock_build, mock_authorize):
-        result = self.dataflow_hook.get_conn()
+    def test_dataflow_client_creation(self, mock_build, mock_authorize, dataflow_hook_template):
+        result = copy.copy(dataflow_hook_template).get_conn()
         mock_build.assert_called_once_with(
             "dataflow", "v1b3", http=mock_authorize.return_value, cache_discovery=False
         )
         assert mock_build.return_value == result
 
     @pytest.mark.parametrize(
-        ("expected_result", "job_name", "append_job_name"),
-        [
-            (JOB_NAME, JOB_NAME, False),
-            ("test-example", "test_example", False),
-            (f"test-dataflow-pipeline-{MOCK_UUID_PREFIX}", JOB_NAME, True),
-            (f"test-example-{MOCK_UUID_PREFIX}", "test_example", True),
-            ("df-job-1", "df-job-1", False),
-            ("df-job", "df-job", False),
-            ("dfjob", "dfjob", False),
-            ("dfjob1", "dfjob1", False),
-        ],
+        ("expected_result", "job_name", "append_job_name"), _VALID_NAME_CASES, ids=_VALID_NAME_IDS
     )
-    @mock.patch(DATAFLOW_STRING.format("uuid.uuid4"), return_value=MOCK_UUID)
-    def test_valid_dataflow_job_name(self, _, expected_result, job_name, append_job_name):
+    @pytest.mark.usefixtures("mock_uuid4")
+    def test_valid_dataflow_job_name(self, expected_result, job_name, append_job_name):
         assert (
             self.dataflow_hook.build_dataflow_job_name(job_name=job_name, append_job_name=append_job_name)
             == expected_result
         )
 
-    @pytest.mark.parametrize("job_name", ["1dfjob@", "dfjob@", "df^jo"])
-    def test_build_dataflow_job_name_with_invalid_value(self, job_name):
-        with pytest.raises(ValueError, match=rf"Invalid job_name \({re.escape(job_name)}\);"):
+    @pytest.mark.parametrize(("job_name", "error_pattern"), _INVALID_NAME_CASES, ids=_INVALID_JOB_NAMES)
+    def test_build_dataflow_job_name_with_invalid_value(self, job_name, error_pattern):
+        with pytest.raises(ValueError, match=error_pattern):
             self.dataflow_hook.build_dataflow_job_name(job_name=job_name, append_job_name=False)
 
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController"))
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_get_job(self, mock_conn, mock_dataflowjob):
-        method_fetch_job_by_id = mock_dataflowjob.return_value.fetch_job_by_id
-
-        self.dataflow_hook.get_job(job_id=TEST_JOB_ID, project_id=TEST_PROJECT_ID, location=TEST_LOCATION)
-        mock_conn.assert_called_once()
-        mock_dataflowjob.assert_called_once_with(
-            dataflow=mock_conn.return_value,
-            project_number=TEST_PROJECT_ID,
-            location=TEST_LOCATION,
-        )
-        method_fetch_job_by_id.assert_called_once_with(TEST_JOB_ID)
-
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController"))
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_fetch_job_metrics_by_id(self, mock_conn, mock_dataflowjob):
-        method_fetch_job_metrics_by_id = mock_dataflowjob.return_value.fetch_job_metrics_by_id
-
-        self.dataflow_hook.fetch_job_metrics_by_id(
+    @pytest.mark.parametrize(
+        ("hook_method", "controller_method"),
+        [
+            ("get_job", "fetch_job_by_id"),
+            ("fetch_job_metrics_by_id", "fetch_job_metrics_by_id"),
+            ("fetch_job_messages_by_id", "fetch_job_messages_by_id"),
+            ("fetch_job_autoscaling_events_by_id", "fetch_job_autoscaling_events_by_id"),
+        ],
+    )
+    @mock.patch(DATAFLOW_JOBS_CONTROLLER)
+    def test_fetch_by_job_id(self, mock_dataflowjob, hook_method, controller_method):
+        getattr(self.dataflow_hook, hook_method)(
             job_id=TEST_JOB_ID, project_id=TEST_PROJECT_ID, location=TEST_LOCATION
         )
-        mock_conn.assert_called_once()
+        self.mock_conn.assert_called_once()
         mock_dataflowjob.assert_called_once_with(
-            dataflow=mock_conn.return_value,
+            dataflow=self.mock_conn.return_value,
             project_number=TEST_PROJECT_ID,
             location=TEST_LOCATION,
         )
-        method_fetch_job_metrics_by_id.assert_called_once_with(TEST_JOB_ID)
+        getattr(mock_dataflowjob.return_value, controller_method).assert_called_once_with(TEST_JOB_ID)
 
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_fetch_job_metrics_by_id_controller(self, mock_conn):
-        method_get_metrics = (
-            mock_conn.return_value.projects.return_value.locations.return_value.jobs.return_value.getMetrics
-        )
+    def test_fetch_job_metrics_by_id_controller(self):
+        mock_locations = self.mock_conn.return_value.projects.return_value.locations
+        method_get_metrics = mock_locations.return_value.jobs.return_value.getMetrics
         self.dataflow_hook.fetch_job_metrics_by_id(
             job_id=TEST_JOB_ID, project_id=TEST_PROJECT_ID, location=TEST_LOCATION
         )
 
-        mock_conn.assert_called_once()
+        self.mock_conn.assert_called_once()
         method_get_metrics.return_value.execute.assert_called_once_with(num_retries=0)
         method_get_metrics.assert_called_once_with(
             jobId=TEST_JOB_ID, projectId=TEST_PROJECT_ID, location=TEST_LOCATION
         )
 
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController"))
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_fetch_job_messages_by_id(self, mock_conn, mock_dataflowjob):
-        method_fetch_job_messages_by_id = mock_dataflowjob.return_value.fetch_job_messages_by_id
-
-        self.dataflow_hook.fetch_job_messages_by_id(
-            job_id=TEST_JOB_ID, project_id=TEST_PROJECT_ID, location=TEST_LOCATION
-        )
-        mock_conn.assert_called_once()
-        mock_dataflowjob.assert_called_once_with(
-            dataflow=mock_conn.return_value,
-            project_number=TEST_PROJECT_ID,
-            location=TEST_LOCATION,
-        )
-        method_fetch_job_messages_by_id.assert_called_once_with(TEST_JOB_ID)
-
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController"))
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_fetch_job_autoscaling_events_by_id(self, mock_conn, mock_dataflowjob):
-        method_fetch_job_autoscaling_events_by_id = (
-            mock_dataflowjob.return_value.fetch_job_autoscaling_events_by_id
-        )
-
-        self.dataflow_hook.fetch_job_autoscaling_events_by_id(
-            job_id=TEST_JOB_ID, project_id=TEST_PROJECT_ID, location=TEST_LOCATION
-        )
-        mock_conn.assert_called_once()
-        mock_dataflowjob.assert_called_once_with(
-            dataflow=mock_conn.return_value,
-            project_number=TEST_PROJECT_ID,
-            location=TEST_LOCATION,
-        )
-        method_fetch_job_autoscaling_events_by_id.assert_called_once_with(TEST_JOB_ID)
-
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController"))
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_wait_for_done(self, mock_conn, mock_dataflowjob):
+    @mock.patch(DATAFLOW_JOBS_CONTROLLER)
+    def test_wait_for_done(self, mock_dataflowjob):
         method_wait_for_done = mock_dataflowjob.return_value.wait_for_done
 
         self.dataflow_hook.wait_for_done(
@@ -326,46 +425,36 @@ class TestDataflowHook:
             location=TEST_LOCATION,
             multiple_jobs=False,
         )
-        mock_conn.assert_called_once()
+        self.mock_conn.assert_called_once()
         mock_dataflowjob.assert_called_once_with(
-            dataflow=mock_conn.return_value,
-            project_number=TEST_PROJECT_ID,
-            name="JOB_NAME",
-            location=TEST_LOCATION,
-            poll_sleep=self.dataflow_hook.poll_sleep,
-            job_id=TEST_JOB_ID,
-            num_retries=self.dataflow_hook.num_retries,
-            multiple_jobs=False,
-            drain_pipeline=self.dataflow_hook.drain_pipeline,
-            cancel_timeout=self.dataflow_hook.cancel_timeout,
-            wait_until_finished=self.dataflow_hook.wait_until_finished,
+            dataflow=self.mock_conn.return_value, **_WAIT_FOR_DONE_EXPECTED
         )
         method_wait_for_done.assert_called_once_with()
 
 
-@pytest.mark.db_test
+@pytest.mark.usefixtures("mock_uuid4")
 class TestDataflowTemplateHook:
-    def setup_method(self):
-        self.dataflow_hook = DataflowHook(gcp_conn_id="google_cloud_default")
-
-    @mock.patch(DATAFLOW_STRING.format("uuid.uuid4"), return_value=MOCK_UUID)
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController"))
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_start_template_dataflow(self, mock_conn, mock_controller, mock_uuid):
-        launch_method = (
-            mock_conn.return_value.projects.return_value.locations.return_value.templates.return_value.launch
-        )
-        launch_method.return_value.execute.return_value = {"job": {"id": TEST_JOB_ID}}
+    @pytest.fixture(autouse=True)
+    def setup_hook(self, dataflow_hook_template):
+        self.dataflow_hook = copy.copy(dataflow_hook_template)
+        self.mock_conn = self.dataflow_hook.get_conn = Mock()
+        mock_locations = self.mock_conn.return_value.projects.return_value.locations.return_value
+        self.template_launch = mock_locations.templates.return_value.launch
+        self.flex_template_launch = mock_locations.flexTemplates.return_value.launch
+
+    @mock.patch(DATAFLOW_JOBS_CONTROLLER)
+    def test_start_template_dataflow(self, mock_controller):
+        self.template_launch.return_value.execute.return_value = {"job": {"id": TEST_JOB_ID}}
         variables = {"zone": "us-central1-f", "tempLocation": "gs://test/temp"}
         self.dataflow_hook.start_template_dataflow(
             job_name=JOB_NAME,
-            variables=copy.deepcopy(variables),
+            variables=dict(variables),
             parameters=PARAMETERS,
             dataflow_template=TEST_TEMPLATE,
             project_id=TEST_PROJECT,
         )
 
-        launch_method.assert_called_once_with(
+        self.template_launch.assert_called_once_with(
             body={
                 "jobName": f"test-dataflow-pipeline-{MOCK_UUID_PREFIX}",
                 "parameters": PARAMETERS,
@@ -377,7 +466,7 @@ class TestDataflowTemplateHook:
         )
 
         mock_controller.assert_called_once_with(
-            dataflow=mock_conn.return_value,
+            dataflow=self.mock_conn.return_value,
             job_id="test-job-id",
             name=f"test-dataflow-pipeline-{MOCK_UUID_PREFIX}",
             num_retries=5,
@@ -391,16 +480,9 @@ class TestDataflowTemplateHook:
         )
         mock_controller.return_value.wait_for_done.assert_called_once()
 
-    @mock.patch(DATAFLOW_STRING.format("uuid.uuid4"), return_value=MOCK_UUID)
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController"))
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_start_template_dataflow_with_custom_region_as_variable(
-        self, mock_conn, mock_controller, mock_uuid
-    ):
-        launch_method = (
-            mock_conn.return_value.projects.return_value.locations.return_value.templates.return_value.launch
-        )
-        launch_method.return_value.execute.return_value = {"job": {"id": TEST_JOB_ID}}
+    @mock.patch(DATAFLOW_JOBS_CONTROLLER)
+    def test_start_template_dataflow_with_custom_region_as_variable(self, mock_controller):
+        self.template_launch.return_value.execute.return_value = {"job": {"id": TEST_JOB_ID}}
         self.dataflow_hook.start_template_dataflow(
             job_name=JOB_NAME,
             variables={"region": TEST_LOCATION},
@@ -409,7 +491,7 @@ class TestDataflowTemplateHook:
             project_id=TEST_PROJECT,
         )
 
-        launch_method.assert_called_once_with(
+        self.template_launch.assert_called_once_with(
             projectId=TEST_PROJECT,
             location=TEST_LOCATION,
             gcsPath=TEST_TEMPLATE,
@@ -417,7 +499,7 @@ class TestDataflowTemplateHook:
         )
 
         mock_controller.assert_called_once_with(
-            dataflow=mock_conn.return_value,
+            dataflow=self.mock_conn.return_value,
             job_id=TEST_JOB_ID,
             name=UNIQUE_JOB_NAME,
             num_retries=5,
@@ -431,16 +513,9 @@ class TestDataflowTemplateHook:
         )
         mock_controller.return_value.wait_for_done.assert_called_once()
 
-    @mock.patch(DATAFLOW_STRING.format("uuid.uuid4"), return_value=MOCK_UUID)
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController"))
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_start_template_dataflow_with_custom_region_as_parameter(
-        self, mock_conn, mock_controller, mock_uuid
-    ):
-        launch_method = (
-            mock_conn.return_value.projects.return_value.locations.return_value.templates.return_value.launch
-        )
-        launch_method.return_value.execute.return_value = {"job": {"id": TEST_JOB_ID}}
+    @mock.patch(DATAFLOW_JOBS_CONTROLLER)
+    def test_start_template_dataflow_with_custom_region_as_parameter(self, mock_controller):
+        self.template_launch.return_value.execute.return_value = {"job": {"id": TEST_JOB_ID}}
 
         self.dataflow_hook.start_template_dataflow(
             job_name=JOB_NAME,
@@ -451,7 +526,7 @@ class TestDataflowTemplateHook:
             project_id=TEST_PROJECT,
         )
 
-        launch_method.assert_called_once_with(
+        self.template_launch.assert_called_once_with(
             body={"jobName": UNIQUE_JOB_NAME, "parameters": PARAMETERS, "environment": {}},
             gcsPath="gs://dataflow-templates/wordcount/template_file",
             projectId=TEST_PROJECT,
@@ -459,7 +534,7 @@ class TestDataflowTemplateHook:
         )
 
         mock_controller.assert_called_once_with(
-            dataflow=mock_conn.return_value,
+            dataflow=self.mock_conn.return_value,
             job_id=TEST_JOB_ID,
             name=UNIQUE_JOB_NAME,
             num_retries=5,
@@ -473,20 +548,14 @@ class TestDataflowTemplateHook:
         )
         mock_controller.return_value.wait_for_done.assert_called_once()
 
-    @mock.patch(DATAFLOW_STRING.format("uuid.uuid4"), return_value=MOCK_UUID)
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController"))
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_start_template_dataflow_with_runtime_env(self, mock_conn, mock_dataflowjob, mock_uuid):
-        options_with_runtime_env = copy.deepcopy(RUNTIME_ENV)
+    @mock.patch(DATAFLOW_JOBS_CONTROLLER)
+    def test_start_template_dataflow_with_runtime_env(self, mock_controller, mock_uuid4):
+        options_with_runtime_env = dict(RUNTIME_ENV)
 
-        dataflowjob_instance = mock_dataflowjob.return_value
+        dataflowjob_instance = mock_controller.return_value
         dataflowjob_instance.wait_for_done.return_value = None
 
-        method = (
-            mock_conn.return_value.projects.return_value.locations.return_value.templates.return_value.launch
-        )
-
-        method.return_value.execute.return_value = {"job": {"id": TEST_JOB_ID}}
+        self.template_launch.return_value.execute.return_value = {"job": {"id": TEST_JOB_ID}}
         self.dataflow_hook.start_template_dataflow(
             job_name=JOB_NAME,
             variables=options_with_runtime_env,
@@ -496,14 +565,14 @@ class TestDataflowTemplateHook:
             environment={"numWorkers": 17},
         )
         body = {"jobName": mock.ANY, "parameters": PARAMETERS, "environment": RUNTIME_ENV}
-        method.assert_called_once_with(
+        self.template_launch.assert_called_once_with(
             projectId=TEST_PROJECT,
             location=DEFAULT_DATAFLOW_LOCATION,
             gcsPath=TEST_TEMPLATE,
             body=body,
         )
-        mock_dataflowjob.assert_called_once_with(
-            dataflow=mock_conn.return_value,
+        mock_controller.assert_called_once_with(
+            dataflow=self.mock_conn.return_value,
             job_id=TEST_JOB_ID,
             location=DEFAULT_DATAFLOW_LOCATION,
             name=f"test-dataflow-pipeline-{MOCK_UUID_PREFIX}",
@@ -515,26 +584,19 @@ class TestDataflowTemplateHook:
             wait_until_finished=None,
             expected_terminal_state=None,
         )
-        mock_uuid.assert_called_once_with()
+        mock_uuid4.assert_called_once_with()
 
-    @mock.patch(DATAFLOW_STRING.format("uuid.uuid4"), return_value=MOCK_UUID)
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController"))
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_start_template_dataflow_update_runtime_env(self, mock_conn, mock_dataflowjob, mock_uuid):
-        options_with_runtime_env = copy.deepcopy(RUNTIME_ENV)
+    @mock.patch(DATAFLOW_JOBS_CONTROLLER)
+    def test_start_template_dataflow_update_runtime_env(self, mock_controller, mock_uuid4):
+        options_with_runtime_env = dict(RUNTIME_ENV)
         del options_with_runtime_env["numWorkers"]
         runtime_env = {"numWorkers": 17}
-        expected_runtime_env = copy.deepcopy(RUNTIME_ENV)
-        expected_runtime_env.update(runtime_env)
+        expected_runtime_env = {**RUNTIME_ENV, **runtime_env}
 
-        dataflowjob_instance = mock_dataflowjob.return_value
+        dataflowjob_instance = mock_controller.return_value
         dataflowjob_instance.wait_for_done.return_value = None
 
-        method = (
-            mock_conn.return_value.projects.return_value.locations.return_value.templates.return_value.launch
-        )
-
-        method.return_value.execute.return_value = {"job": {"id": TEST_JOB_ID}}
+        self.template_launch.return_value.execute.return_value = {"job": {"id": TEST_JOB_ID}}
         self.dataflow_hook.start_template_dataflow(
             job_name=JOB_NAME,
             variables=options_with_runtime_env,
@@ -544,14 +606,14 @@ class TestDataflowTemplateHook:
             environment=runtime_env,
         )
         body = {"jobName": mock.ANY, "parameters": PARAMETERS, "environment": expected_runtime_env}
-        method.assert_called_once_with(
+        self.template_launch.assert_called_once_with(
             projectId=TEST_PROJECT,
             location=DEFAULT_DATAFLOW_LOCATION,
             gcsPath=TEST_TEMPLATE,
             body=body,
         )
-        mock_dataflowjob.assert_called_once_with(
-            dataflow=mock_conn.return_value,
+        mock_controller.assert_called_once_with(
+            dataflow=self.mock_conn.return_value,
             job_id=TEST_JOB_ID,
             location=DEFAULT_DATAFLOW_LOCATION,
             name=f"test-dataflow-pipeline-{MOCK_UUID_PREFIX}",
@@ -563,25 +625,20 @@ class TestDataflowTemplateHook:
             wait_until_finished=None,
             expected_terminal_state=None,
         )
-        mock_uuid.assert_called_once_with()
+        mock_uuid4.assert_called_once_with()
 
-    @mock.patch(DATAFLOW_STRING.format("uuid.uuid4"), return_value=MOCK_UUID)
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_launch_job_with_template(self, mock_conn, mock_uuid):
-        launch_method = (
-            mock_conn.return_value.projects.return_value.locations.return_value.templates.return_value.launch
-        )
-        launch_method.return_value.execute.return_value = {"job": {"id": TEST_JOB_ID}}
+    def test_launch_job_with_template(self):
+        self.template_launch.return_value.execute.return_value = {"job": {"id": TEST_JOB_ID}}
         variables = {"zone": "us-central1-f", "tempLocation": "gs://test/temp"}
         result = self.dataflow_hook.launch_job_with_template(
             job_name=JOB_NAME,
-            variables=copy.deepcopy(variables),
+            variables=dict(variables),
             parameters=PARAMETERS,
             dataflow_template=TEST_TEMPLATE,
             project_id=TEST_PROJECT,
         )
 
-        launch_method.assert_called_once_with(
+        self.template_launch.assert_called_once_with(
             body={
                 "jobName": f"test-dataflow-pipeline-{MOCK_UUID_PREFIX}",
                 "parameters": PARAMETERS,
@@ -593,17 +650,14 @@ class TestDataflowTemplateHook:
         )
         assert result == {"id": TEST_JOB_ID}
 
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController"))
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_start_flex_template(self, mock_conn, mock_controller):
+    @mock.patch(DATAFLOW_JOBS_CONTROLLER)
+    def test_start_flex_template(self, mock_controller):
         expected_job = {"id": TEST_JOB_ID}
 
-        mock_locations = mock_conn.return_value.projects.return_value.locations
-        launch_method = mock_locations.return_value.flexTemplates.return_value.launch
-        launch_method.return_value.execute.return_value = {"job": expected_job}
+        self.flex_template_launch.return_value.execute.return_value = {"job": expected_job}
         mock_controller.return_value.get_jobs.return_value = [{"id": TEST_JOB_ID}]
 
-        on_new_job_callback = mock.MagicMock()
+        on_new_job_callback = mock.Mock()
         result = self.dataflow_hook.start_flex_template(
             body={"launchParameter": TEST_FLEX_PARAMETERS},
             location=TEST_LOCATION,
@@ -611,13 +665,13 @@ class TestDataflowTemplateHook:
             on_new_job_callback=on_new_job_callback,
         )
         on_new_job_callback.assert_called_once_with(expected_job)
-        launch_method.assert_called_once_with(
+        self.flex_template_launch.assert_called_once_with(
             projectId="test-project-id",
             body={"launchParameter": TEST_FLEX_PARAMETERS},
             location=TEST_LOCATION,
         )
         mock_controller.assert_called_once_with(
-            dataflow=mock_conn.return_value,
+            dataflow=self.mock_conn.return_value,
             project_number=TEST_PROJECT_ID,
             job_id=TEST_JOB_ID,
             location=TEST_LOCATION,
@@ -629,34 +683,30 @@ class TestDataflowTemplateHook:
         mock_controller.return_value.get_jobs.assert_called_once_with(refresh=True)
         assert result == {"id": TEST_JOB_ID}
 
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_launch_job_with_flex_template(self, mock_conn):
+    def test_launch_job_with_flex_template(self):
         expected_job = {"id": TEST_JOB_ID}
 
-        mock_locations = mock_conn.return_value.projects.return_value.locations
-        launch_method = mock_locations.return_value.flexTemplates.return_value.launch
-        launch_method.return_value.execute.return_value = {"job": expected_job}
+        self.flex_template_launch.return_value.execute.return_value = {"job": expected_job}
 
         result = self.dataflow_hook.launch_job_with_flex_template(
             body={"launchParameter": TEST_FLEX_PARAMETERS},
             location=TEST_LOCATION,
             project_id=TEST_PROJECT_ID,
         )
-        launch_method.assert_called_once_with(
+        self.flex_template_launch.assert_called_once_with(
             projectId="test-project-id",
             body={"launchParameter": TEST_FLEX_PARAMETERS},
             location=TEST_LOCATION,
         )
         assert result == {"id": TEST_JOB_ID}
 
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController"))
-    @mock.patch(DATAFLOW_STRING.format("DataflowHook.get_conn"))
-    def test_cancel_job(self, mock_get_conn, jobs_controller):
+    @mock.patch(DATAFLOW_JOBS_CONTROLLER)
+    def test_cancel_job(self, jobs_controller):
         self.dataflow_hook.cancel_job(
             job_name=UNIQUE_JOB_NAME, job_id=TEST_JOB_ID, project_id=TEST_PROJECT, location=TEST_LOCATION
         )
         jobs_controller.assert_called_once_with(
-            dataflow=mock_get_conn.return_value,
+            dataflow=self.mock_conn.return_value,
             job_id=TEST_JOB_ID,
             location=TEST_LOCATION,
             name=UNIQUE_JOB_NAME,
@@ -675,68 +725,65 @@ class TestDataflowTemplateHook:
 
 class TestDataflowJob:
     def setup_method(self):
-        self.mock_dataflow = MagicMock()
+        self.mock_dataflow = Mock(spec_set=["projects"])
+        self.mock_jobs = self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value
+        self.mock_jobs.list_next.return_value = None
+        self.mock_messages = self.mock_jobs.messages.return_value
+        self.make_controller = functools.partial(
+            _DataflowJobsController,
+            dataflow=self.mock_dataflow,
+            project_number=TEST_PROJECT,
+            location=TEST_LOCATION,
+            poll_sleep=0,
+            num_retries=20,
+        )
+
+    @pytest.fixture(autouse=True)
+    def _mock_sleep(self):
+        with mock.patch("time.sleep") as mock_sleep:
+            self.mock_sleep = mock_sleep
+            yield
 
     def test_dataflow_job_init_with_job_id(self):
-        mock_jobs = MagicMock()
-        self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value = mock_jobs
-        _DataflowJobsController(
-            self.mock_dataflow, TEST_PROJECT, TEST_LOCATION, 10, UNIQUE_JOB_NAME, TEST_JOB_ID
-        ).get_jobs()
-        mock_jobs.get.assert_called_once_with(
+        self.mock_jobs.get.return_value.execute.return_value = _job(
+            DataflowJobStatus.JOB_STATE_DONE, job_id=TEST_JOB_ID, name=UNIQUE_JOB_NAME
+        )
+        self.make_controller(name=UNIQUE_JOB_NAME, job_id=TEST_JOB_ID).get_jobs()
+        self.mock_jobs.get.assert_called_once_with(
             projectId=TEST_PROJECT, location=TEST_LOCATION, jobId=TEST_JOB_ID
         )
 
     def test_dataflow_job_init_without_job_id(self):
-        job = {"id": TEST_JOB_ID, "name": UNIQUE_JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_DONE}
+        job = _job(DataflowJobStatus.JOB_STATE_DONE, job_id=TEST_JOB_ID, name=UNIQUE_JOB_NAME)
 
-        mock_list = self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list
-        (mock_list.return_value.execute.return_value) = {"jobs": [job]}
+        mock_list = self.mock_jobs.list
+        mock_list.return_value.execute.return_value = {"jobs": [job]}
 
-        (
-            self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list_next.return_value
-        ) = None
-
-        _DataflowJobsController(
-            self.mock_dataflow, TEST_PROJECT, TEST_LOCATION, 10, UNIQUE_JOB_NAME
-        ).get_jobs()
+        self.make_controller(name=UNIQUE_JOB_NAME).get_jobs()
 
         mock_list.assert_called_once_with(projectId=TEST_PROJECT, location=TEST_LOCATION)
 
     def test_dataflow_job_wait_for_multiple_jobs(self):
-        job = {
-            "id": TEST_JOB_ID,
-            "name": UNIQUE_JOB_NAME,
-            "type": DataflowJobType.JOB_TYPE_BATCH,
-            "currentState": DataflowJobStatus.JOB_STATE_DONE,
-        }
+        job = _job(
+            DataflowJobStatus.JOB_STATE_DONE,
+            DataflowJobType.JOB_TYPE_BATCH,
+            job_id=TEST_JOB_ID,
+            name=UNIQUE_JOB_NAME,
+        )
 
-        (
-            self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list.return_value.execute.return_value
-        ) = {"jobs": [job, job]}
-        (
-            self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list_next.return_value
-        ) = None
+        self.mock_jobs.list.return_value.execute.return_value = {"jobs": [job, job]}
 
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
+        dataflow_job = self.make_controller(
             name=UNIQUE_JOB_NAME,
-            location=TEST_LOCATION,
             poll_sleep=10,
             job_id=TEST_JOB_ID,
-            num_retries=20,
             multiple_jobs=True,
         )
         dataflow_job.wait_for_done()
 
-        self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list.assert_called_once_with(
-            location=TEST_LOCATION, projectId=TEST_PROJECT
-        )
+        self.mock_jobs.list.assert_called_once_with(location=TEST_LOCATION, projectId=TEST_PROJECT)
 
-        self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list.return_value.execute.assert_called_once_with(
-            num_retries=20
-        )
+        self.mock_jobs.list.return_value.execute.assert_called_once_with(num_retries=20)
 
         assert dataflow_job.get_jobs() == [job, job]
 
@@ -754,67 +801,33 @@ class TestDataflowJob:
         ],
     )
     def test_dataflow_job_wait_for_multiple_jobs_and_one_in_terminal_state(self, state, exception_regex):
-        (
-            self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list.return_value.execute.return_value
-        ) = {
+        self.mock_jobs.list.return_value.execute.return_value = {
             "jobs": [
-                {
-                    "id": "id-1",
-                    "name": "name-1",
-                    "type": DataflowJobType.JOB_TYPE_BATCH,
-                    "currentState": DataflowJobStatus.JOB_STATE_DONE,
-                },
-                {
-                    "id": "id-2",
-                    "name": "name-2",
-                    "type": DataflowJobType.JOB_TYPE_BATCH,
-                    "currentState": state,
-                },
+                _job(
+                    DataflowJobStatus.JOB_STATE_DONE,
+                    DataflowJobType.JOB_TYPE_BATCH,
+                    job_id="id-1",
+                    name="name-1",
+                ),
+                _job(state, DataflowJobType.JOB_TYPE_BATCH),
             ]
         }
-        (
-            self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list_next.return_value
-        ) = None
 
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
+        dataflow_job = self.make_controller(
             name="name-",
-            location=TEST_LOCATION,
-            poll_sleep=0,
-            job_id=None,
-            num_retries=20,
             multiple_jobs=True,
         )
         with pytest.raises(AirflowException, match=exception_regex):
             dataflow_job.wait_for_done()
 
     def test_dataflow_job_wait_for_multiple_jobs_and_streaming_jobs(self):
-        mock_jobs_list = (
-            self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list
-        )
+        mock_jobs_list = self.mock_jobs.list
         mock_jobs_list.return_value.execute.return_value = {
-            "jobs": [
-                {
-                    "id": "id-2",
-                    "name": "name-2",
-                    "currentState": DataflowJobStatus.JOB_STATE_RUNNING,
-                    "type": DataflowJobType.JOB_TYPE_STREAMING,
-                }
-            ]
+            "jobs": [_job(DataflowJobStatus.JOB_STATE_RUNNING, DataflowJobType.JOB_TYPE_STREAMING)]
         }
-        (
-            self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list_next.return_value
-        ) = None
 
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
+        dataflow_job = self.make_controller(
             name="name-",
-            location=TEST_LOCATION,
-            poll_sleep=0,
-            job_id=None,
-            num_retries=20,
             multiple_jobs=True,
         )
         dataflow_job.wait_for_done()
@@ -822,60 +835,37 @@ class TestDataflowJob:
         assert mock_jobs_list.call_count == 1
 
     def test_dataflow_job_wait_for_single_jobs(self):
-        job = {
-            "id": TEST_JOB_ID,
-            "name": UNIQUE_JOB_NAME,
-            "type": DataflowJobType.JOB_TYPE_BATCH,
-            "currentState": DataflowJobStatus.JOB_STATE_DONE,
-        }
-
-        (
-            self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.get.return_value.execute.return_value
-        ) = job
+        job = _job(
+            DataflowJobStatus.JOB_STATE_DONE,
+            DataflowJobType.JOB_TYPE_BATCH,
+            job_id=TEST_JOB_ID,
+            name=UNIQUE_JOB_NAME,
+        )
 
-        (
-            self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list_next.return_value
-        ) = None
+        self.mock_jobs.get.return_value.execute.return_value = job
 
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
+        dataflow_job = self.make_controller(
             name=UNIQUE_JOB_NAME,
-            location=TEST_LOCATION,
             poll_sleep=10,
             job_id=TEST_JOB_ID,
-            num_retries=20,
             multiple_jobs=False,
         )
         dataflow_job.wait_for_done()
 
-        self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.get.assert_called_once_with(
+        self.mock_jobs.get.assert_called_once_with(
             jobId=TEST_JOB_ID, location=TEST_LOCATION, projectId=TEST_PROJECT
         )
 
-        self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.get.return_value.execute.assert_called_once_with(
-            num_retries=20
-        )
+        self.mock_jobs.get.return_value.execute.assert_called_once_with(num_retries=20)
 
         assert dataflow_job.get_jobs() == [job]
 
     def test_dataflow_job_is_job_running_with_no_job(self):
-        mock_jobs_list = (
-            self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list
-        )
+        mock_jobs_list = self.mock_jobs.list
         mock_jobs_list.return_value.execute.return_value = {"jobs": []}
-        (
-            self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list_next.return_value
-        ) = None
 
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
+        dataflow_job = self.make_controller(
             name="name-",
-            location=TEST_LOCATION,
-            poll_sleep=0,
-            job_id=None,
-            num_retries=20,
             multiple_jobs=True,
         )
         result = dataflow_job.is_job_running()
@@ -883,217 +873,28 @@ class TestDataflowJob:
         assert result is False
 
     @pytest.mark.parametrize(
-        ("job_type", "job_state", "wait_until_finished", "expected_result"),
-        [
-            # RUNNING
-            (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_RUNNING, None, False),
-            (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_RUNNING, None, True),
-            (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_RUNNING, True, False),
-            (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_RUNNING, True, False),
-            (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_RUNNING, False, True),
-            (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_RUNNING, False, True),
-            # AWAITING STATE
-            (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_PENDING, None, False),
-            (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_PENDING, None, False),
-            (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_PENDING, True, False),
-            (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_PENDING, True, False),
-            (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_PENDING, False, True),
-            (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_PENDING, False, True),
-        ],
-    )
-    def test_check_dataflow_job_state_wait_until_finished(
-        self, job_type, job_state, wait_until_finished, expected_result
-    ):
-        job = {"id": "id-2", "name": "name-2", "type": job_type, "currentState": job_state}
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
-            name="name-",
-            location=TEST_LOCATION,
-            poll_sleep=0,
-            job_id=None,
-            num_retries=20,
-            multiple_jobs=True,
-            wait_until_finished=wait_until_finished,
-        )
-        result = dataflow_job.job_reached_terminal_state(job, wait_until_finished)
-        assert result == expected_result
-
-    @pytest.mark.parametrize(
-        ("jobs", "wait_until_finished", "expected_result"),
-        [
-            # STREAMING
-            (
-                [
-                    (None, DataflowJobStatus.JOB_STATE_QUEUED),
-                    (None, DataflowJobStatus.JOB_STATE_PENDING),
-                    (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_RUNNING),
-                ],
-                None,
-                True,
-            ),
-            (
-                [
-                    (None, DataflowJobStatus.JOB_STATE_QUEUED),
-                    (None, DataflowJobStatus.JOB_STATE_PENDING),
-                    (DataflowJobType.JOB_TYPE_STREAMING, DataflowJobStatus.JOB_STATE_RUNNING),
-                ],
-                True,
-                False,
-            ),
-            # BATCH
-            (
-                [
-                    (None, DataflowJobStatus.JOB_STATE_QUEUED),
-                    (None, DataflowJobStatus.JOB_STATE_PENDING),
-                    (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_RUNNING),
-                ],
-                False,
-                True,
-            ),
-            (
-                [
-                    (None, DataflowJobStatus.JOB_STATE_QUEUED),
-                    (None, DataflowJobStatus.JOB_STATE_PENDING),
-                    (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_RUNNING),
-                ],
-                None,
-                False,
-            ),
-            (
-                [
-                    (None, DataflowJobStatus.JOB_STATE_QUEUED),
-                    (None, DataflowJobStatus.JOB_STATE_PENDING),
-                    (DataflowJobType.JOB_TYPE_BATCH, DataflowJobStatus.JOB_STATE_DONE),
-                ],
-                None,
-                True,
-            ),
-        ],
+        ("job_type", "job_state", "wait_until_finished", "expected"), _JOB_STATE_CASES, ids=_JOB_STATE_IDS
     )
+    def test_check_dataflow_job_state(self, job_type, job_state, wait_until_finished, expected):
+        job = _job(job_state, job_type)
+        terminal_state_helper = DataflowJobTerminalStateHelper()
+        if isinstance(expected, str):
+            with pytest.raises(AirflowException, match=expected):
+                terminal_state_helper.job_reached_terminal_state(job, wait_until_finished)
+        else:
+            assert terminal_state_helper.job_reached_terminal_state(job, wait_until_finished) == expected
+
+    @pytest.mark.parametrize(("jobs", "wait_until_finished", "expected_result"), _JOB_STATE_SEQUENCE_CASES)
     def test_check_dataflow_job_state_without_job_type_changed_on_terminal_state(
         self, jobs, wait_until_finished, expected_result
     ):
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
-            name="name-",
-            location=TEST_LOCATION,
-            poll_sleep=0,
-            job_id=None,
-            num_retries=20,
-            multiple_jobs=True,
-            wait_until_finished=wait_until_finished,
-        )
+        terminal_state_helper = DataflowJobTerminalStateHelper()
         result = False
         for current_job in jobs:
-            job = {"id": "id-2", "name": "name-2", "type": current_job[0], "currentState": current_job[1]}
-            result = dataflow_job.job_reached_terminal_state(job, wait_until_finished)
+            job = _job(current_job[1], current_job[0])
+            result = terminal_state_helper.job_reached_terminal_state(job, wait_until_finished)
         assert result == expected_result
 
-    @pytest.mark.parametrize(
-        ("job_state", "wait_until_finished", "expected_result"),
-        [
-            # DONE
-            (DataflowJobStatus.JOB_STATE_DONE, None, True),
-            (DataflowJobStatus.JOB_STATE_DONE, True, True),
-            (DataflowJobStatus.JOB_STATE_DONE, False, True),
-            # RUNNING
-            (DataflowJobStatus.JOB_STATE_RUNNING, None, False),
-            (DataflowJobStatus.JOB_STATE_RUNNING, True, False),
-            (DataflowJobStatus.JOB_STATE_RUNNING, False, True),
-            # AWAITING STATE
-            (DataflowJobStatus.JOB_STATE_PENDING, None, False),
-            (DataflowJobStatus.JOB_STATE_PENDING, True, False),
-            (DataflowJobStatus.JOB_STATE_PENDING, False, True),
-        ],
-    )
-    def test_check_dataflow_job_state_without_job_type(self, job_state, wait_until_finished, expected_result):
-        job = {"id": "id-2", "name": "name-2", "currentState": job_state}
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
-            name="name-",
-            location=TEST_LOCATION,
-            poll_sleep=0,
-            job_id=None,
-            num_retries=20,
-            multiple_jobs=True,
-            wait_until_finished=wait_until_finished,
-        )
-        result = dataflow_job.job_reached_terminal_state(job, wait_until_finished)
-        assert result == expected_result
-
-    @pytest.mark.parametrize(
-        ("job_type", "job_state", "exception_regex"),
-        [
-            (
-                DataflowJobType.JOB_TYPE_BATCH,
-                DataflowJobStatus.JOB_STATE_FAILED,
-                "JOB_STATE_FAILED",
-            ),
-            (
-                DataflowJobType.JOB_TYPE_STREAMING,
-                DataflowJobStatus.JOB_STATE_FAILED,
-                "JOB_STATE_FAILED",
-            ),
-            (
-                DataflowJobType.JOB_TYPE_STREAMING,
-                DataflowJobStatus.JOB_STATE_UNKNOWN,
-                "JOB_STATE_UNKNOWN",
-            ),
-            (
-                DataflowJobType.JOB_TYPE_BATCH,
-                DataflowJobStatus.JOB_STATE_UNKNOWN,
-                "JOB_STATE_UNKNOWN",
-            ),
-            (
-                DataflowJobType.JOB_TYPE_BATCH,
-                DataflowJobStatus.JOB_STATE_CANCELLED,
-                "JOB_STATE_CANCELLED",
-            ),
-            (
-                DataflowJobType.JOB_TYPE_STREAMING,
-                DataflowJobStatus.JOB_STATE_CANCELLED,
-                "JOB_STATE_CANCELLED",
-            ),
-            (
-                DataflowJobType.JOB_TYPE_BATCH,
-                DataflowJobStatus.JOB_STATE_DRAINED,
-                "JOB_STATE_DRAINED",
-            ),
-            (
-                DataflowJobType.JOB_TYPE_STREAMING,
-                DataflowJobStatus.JOB_STATE_DRAINED,
-                "JOB_STATE_DRAINED",
-            ),
-            (
-                DataflowJobType.JOB_TYPE_BATCH,
-                DataflowJobStatus.JOB_STATE_UPDATED,
-                "JOB_STATE_UPDATED",
-            ),
-            (
-                DataflowJobType.JOB_TYPE_STREAMING,
-                DataflowJobStatus.JOB_STATE_UPDATED,
-                "JOB_STATE_UPDATED",
-            ),
-        ],
-    )
-    def test_check_dataflow_job_state_terminal_state(self, job_type, job_state, exception_regex):
-        job = {"id": "id-2", "name": "name-2", "type": job_type, "currentState": job_state}
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
-            name="name-",
-            location=TEST_LOCATION,
-            poll_sleep=0,
-            job_id=None,
-            num_retries=20,
-            multiple_jobs=True,
-        )
-        with pytest.raises(AirflowException, match=exception_regex):
-            dataflow_job.job_reached_terminal_state(job)
-
     @pytest.mark.parametrize(
         ("job_type", "expected_terminal_state", "match"),
         [
@@ -1115,104 +916,59 @@ class TestDataflowJob:
         ],
     )
     def test_check_dataflow_job_state__invalid_expected_state(self, job_type, expected_terminal_state, match):
-        job = {
-            "id": "id-2",
-            "name": "name-2",
-            "type": job_type,
-            "currentState": DataflowJobStatus.JOB_STATE_QUEUED,
-        }
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
-            name=UNIQUE_JOB_NAME,
-            location=TEST_LOCATION,
-            poll_sleep=0,
-            job_id=TEST_JOB_ID,
-            num_retries=20,
-            multiple_jobs=False,
-            expected_terminal_state=expected_terminal_state,
-        )
+        job = _job(DataflowJobStatus.JOB_STATE_QUEUED, job_type)
+        terminal_state_helper = DataflowJobTerminalStateHelper()
         with pytest.raises(AirflowException, match=match):
-            dataflow_job.job_reached_terminal_state(job, custom_terminal_state=expected_terminal_state)
+            terminal_state_helper.job_reached_terminal_state(
+                job, custom_terminal_state=expected_terminal_state
+            )
 
     def test_dataflow_job_cancel_job(self):
-        mock_jobs = self.mock_dataflow.projects.return_value.locations.return_value.jobs
-        get_method = mock_jobs.return_value.get
-        get_method.return_value.execute.side_effect = [
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_RUNNING},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_PENDING},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_QUEUED},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_CANCELLING},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_DRAINING},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_STOPPED},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_CANCELLED},
-        ]
-
-        mock_jobs.return_value.list_next.return_value = None
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
+        get_method = self.mock_jobs.get
+        get_method.return_value.execute.side_effect = _job_states(
+            DataflowJobStatus.JOB_STATE_RUNNING,
+            DataflowJobStatus.JOB_STATE_PENDING,
+            DataflowJobStatus.JOB_STATE_QUEUED,
+            DataflowJobStatus.JOB_STATE_CANCELLING,
+            DataflowJobStatus.JOB_STATE_DRAINING,
+            DataflowJobStatus.JOB_STATE_STOPPED,
+            DataflowJobStatus.JOB_STATE_CANCELLED,
+        )
+
+        dataflow_job = self.make_controller(
             name=UNIQUE_JOB_NAME,
-            location=TEST_LOCATION,
-            poll_sleep=0,
             job_id=TEST_JOB_ID,
-            num_retries=20,
             multiple_jobs=False,
         )
         dataflow_job.cancel()
 
-        get_method.assert_called_with(jobId=TEST_JOB_ID, location=TEST_LOCATION, projectId=TEST_PROJECT)
-        get_method.return_value.execute.assert_called_with(num_retries=20)
-
-        mock_update = mock_jobs.return_value.update
-        mock_update.assert_called_once_with(
-            body={"requestedState": "JOB_STATE_CANCELLED"},
-            jobId="test-job-id",
-            location=TEST_LOCATION,
-            projectId="test-project",
-        )
-        mock_update.return_value.execute.assert_called_once_with(num_retries=20)
+        self.mock_jobs.assert_has_calls(_cancel_job_calls(DataflowJobStatus.JOB_STATE_CANCELLED))
+        self.mock_jobs.update.assert_called_once()
 
     @mock.patch("airflow.providers.google.cloud.hooks.dataflow.timeout")
-    @mock.patch("time.sleep")
-    def test_dataflow_job_cancel_job_cancel_timeout(self, mock_sleep, mock_timeout):
-        mock_jobs = self.mock_dataflow.projects.return_value.locations.return_value.jobs
-        get_method = mock_jobs.return_value.get
-        get_method.return_value.execute.side_effect = [
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_CANCELLING},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_CANCELLING},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_CANCELLING},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_CANCELLING},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_CANCELLED},
-        ]
+    def test_dataflow_job_cancel_job_cancel_timeout(self, mock_timeout):
+        get_method = self.mock_jobs.get
+        get_method.return_value.execute.side_effect = _job_states(
+            DataflowJobStatus.JOB_STATE_CANCELLING,
+            DataflowJobStatus.JOB_STATE_CANCELLING,
+            DataflowJobStatus.JOB_STATE_CANCELLING,
+            DataflowJobStatus.JOB_STATE_CANCELLING,
+            DataflowJobStatus.JOB_STATE_CANCELLED,
+        )
 
-        mock_jobs.return_value.list_next.return_value = None
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
+        dataflow_job = self.make_controller(
             name=UNIQUE_JOB_NAME,
-            location=TEST_LOCATION,
             poll_sleep=4,
             job_id=TEST_JOB_ID,
-            num_retries=20,
             multiple_jobs=False,
             cancel_timeout=10,
         )
         dataflow_job.cancel()
 
-        get_method.assert_called_with(jobId=TEST_JOB_ID, location=TEST_LOCATION, projectId=TEST_PROJECT)
-        get_method.return_value.execute.assert_called_with(num_retries=20)
-
-        mock_update = mock_jobs.return_value.update
-        mock_update.assert_called_once_with(
-            body={"requestedState": "JOB_STATE_CANCELLED"},
-            jobId="test-job-id",
-            location=TEST_LOCATION,
-            projectId="test-project",
-        )
-        mock_update.return_value.execute.assert_called_once_with(num_retries=20)
+        self.mock_jobs.assert_has_calls(_cancel_job_calls(DataflowJobStatus.JOB_STATE_CANCELLED))
+        self.mock_jobs.update.assert_called_once()
 
-        mock_sleep.assert_has_calls([mock.call(4), mock.call(4), mock.call(4)])
+        self.mock_sleep.assert_has_calls([mock.call(4), mock.call(4), mock.call(4)])
         mock_timeout.assert_called_once_with(
             seconds=10, error_message="Canceling jobs failed due to timeout (10s): test-job-id"
         )
@@ -1227,67 +983,35 @@ class TestDataflowJob:
         ],
     )
     def test_dataflow_job_cancel_or_drain_job(self, drain_pipeline, job_type, requested_state):
-        job = {
-            "id": TEST_JOB_ID,
-            "name": UNIQUE_JOB_NAME,
-            "currentState": DataflowJobStatus.JOB_STATE_RUNNING,
-            "type": job_type,
-        }
-        get_method = self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.get
+        job = _job(DataflowJobStatus.JOB_STATE_RUNNING, job_type, job_id=TEST_JOB_ID, name=UNIQUE_JOB_NAME)
+        get_method = self.mock_jobs.get
         get_method.return_value.execute.return_value = job
 
-        job_list_nest_method = (
-            self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list_next
-        )
-        job_list_nest_method.return_value = None
-
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
+        dataflow_job = self.make_controller(
             name=UNIQUE_JOB_NAME,
-            location=TEST_LOCATION,
             poll_sleep=10,
             job_id=TEST_JOB_ID,
-            num_retries=20,
             multiple_jobs=False,
             drain_pipeline=drain_pipeline,
             cancel_timeout=None,
         )
         dataflow_job.cancel()
 
-        get_method.assert_called_once_with(jobId=TEST_JOB_ID, location=TEST_LOCATION, projectId=TEST_PROJECT)
-
-        get_method.return_value.execute.assert_called_once_with(num_retries=20)
-
-        mock_update = self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.update
-        mock_update.assert_called_once_with(
-            body={"requestedState": requested_state},
-            jobId="test-job-id",
-            location=TEST_LOCATION,
-            projectId="test-project",
-        )
-        mock_update.return_value.execute.assert_called_once_with(num_retries=20)
+        assert self.mock_jobs.mock_calls == _cancel_job_calls(requested_state)
 
     def test_dataflow_job_cancel_job_no_running_jobs(self):
-        mock_jobs = self.mock_dataflow.projects.return_value.locations.return_value.jobs
-        get_method = mock_jobs.return_value.get
-        get_method.return_value.execute.side_effect = [
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_DONE},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_UPDATED},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_DRAINED},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_FAILED},
-            {"id": TEST_JOB_ID, "name": JOB_NAME, "currentState": DataflowJobStatus.JOB_STATE_CANCELLED},
-        ]
+        get_method = self.mock_jobs.get
+        get_method.return_value.execute.side_effect = _job_states(
+            DataflowJobStatus.JOB_STATE_DONE,
+            DataflowJobStatus.JOB_STATE_UPDATED,
+            DataflowJobStatus.JOB_STATE_DRAINED,
+            DataflowJobStatus.JOB_STATE_FAILED,
+            DataflowJobStatus.JOB_STATE_CANCELLED,
+        )
 
-        mock_jobs.return_value.list_next.return_value = None
-        dataflow_job = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
+        dataflow_job = self.make_controller(
             name=UNIQUE_JOB_NAME,
-            location=TEST_LOCATION,
-            poll_sleep=0,
             job_id=TEST_JOB_ID,
-            num_retries=20,
             multiple_jobs=False,
         )
         dataflow_job.cancel()
@@ -1295,19 +1019,16 @@ class TestDataflowJob:
         get_method.assert_called_with(jobId=TEST_JOB_ID, location=TEST_LOCATION, projectId=TEST_PROJECT)
         get_method.return_value.execute.assert_called_with(num_retries=20)
 
-        mock_jobs.return_value.update.assert_not_called()
+        self.mock_jobs.update.assert_not_called()
 
     def test_fetch_list_job_messages_responses(self):
-        mock_list = self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.messages.return_value.list
-        mock_list_next = self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.messages.return_value.list_next
+        mock_list = self.mock_messages.list
+        mock_list_next = self.mock_messages.list_next
 
         mock_list.return_value.execute.return_value = "response_1"
         mock_list_next.return_value = None
 
-        jobs_controller = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
-            location=TEST_LOCATION,
+        jobs_controller = self.make_controller(
             job_id=TEST_JOB_ID,
         )
         result = list(jobs_controller._fetch_list_job_messages_responses(TEST_JOB_ID))
@@ -1319,49 +1040,34 @@ class TestDataflowJob:
         assert result == ["response_1"]
 
     def test_fetch_all_jobs_when_no_jobs_returned(self):
-        (
-            self.mock_dataflow.projects.return_value.locations.return_value.jobs.return_value.list.return_value.execute.return_value
-        ) = {}
+        self.mock_jobs.list.return_value.execute.return_value = {}
 
-        jobs_controller = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
-            location=TEST_LOCATION,
+        jobs_controller = self.make_controller(
             job_id=TEST_JOB_ID,
         )
         result = jobs_controller._fetch_all_jobs()
         assert result == []
 
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController._fetch_list_job_messages_responses"))
+    @mock.patch(DATAFLOW_FETCH_JOB_MESSAGES_RESPONSES)
     def test_fetch_job_messages_by_id(self, mock_fetch_responses):
-        mock_fetch_responses.return_value = iter(
-            [
-                {"jobMessages": ["message_1"]},
-                {"jobMessages": ["message_2"]},
-            ]
+        mock_fetch_responses.return_value = (
+            {"jobMessages": ["message_1"]},
+            {"jobMessages": ["message_2"]},
         )
-        jobs_controller = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
-            location=TEST_LOCATION,
+        jobs_controller = self.make_controller(
             job_id=TEST_JOB_ID,
         )
         result = jobs_controller.fetch_job_messages_by_id(TEST_JOB_ID)
         mock_fetch_responses.assert_called_once_with(job_id=TEST_JOB_ID)
         assert result == ["message_1", "message_2"]
 
-    @mock.patch(DATAFLOW_STRING.format("_DataflowJobsController._fetch_list_job_messages_responses"))
+    @mock.patch(DATAFLOW_FETCH_JOB_MESSAGES_RESPONSES)
     def test_fetch_job_autoscaling_events_by_id(self, mock_fetch_responses):
-        mock_fetch_responses.return_value = iter(
-            [
-                {"autoscalingEvents": ["event_1"]},
-                {"autoscalingEvents": ["event_2"]},
-            ]
+        mock_fetch_responses.return_value = (
+            {"autoscalingEvents": ["event_1"]},
+            {"autoscalingEvents": ["event_2"]},
         )
-        jobs_controller = _DataflowJobsController(
-            dataflow=self.mock_dataflow,
-            project_number=TEST_PROJECT,
-            location=TEST_LOCATION,
+        jobs_controller = self.make_controller(
             job_id=TEST_JOB_ID,
         )
         result = jobs_controller.fetch_job_autoscaling_events_by_id(TEST_JOB_ID)
@@ -1369,48 +1075,41 @@ class TestDataflowJob:
         assert result == ["event_1", "event_2"]
 
 
-@pytest.mark.db_test
 class TestDataflowPipelineHook:
-    def setup_method(self):
-        self.dataflow_hook = DataflowHook(gcp_conn_id="google_cloud_default")
+    @pytest.fixture(autouse=True)
+    def setup_hook(self, dataflow_hook_template):
+        self.dataflow_hook = copy.copy(dataflow_hook_template)
+        mock_pipelines_conn = self.dataflow_hook.get_pipelines_conn = Mock()
+        mock_locations = mock_pipelines_conn.return_value.projects.return_value.locations.return_value
+        self.mock_pipelines = mock_locations.pipelines.return_value
 
     @mock.patch("airflow.providers.google.cloud.hooks.dataflow.DataflowHook._authorize")
     @mock.patch("airflow.providers.google.cloud.hooks.dataflow.build")
-    def test_get_conn(self, mock_build, mock_authorize):
+    def test_get_conn(self, mock_build, mock_authorize, dataflow_hook_template):
         """
         Test that get_conn is called with the correct params and
         returns the correct API address
         """
-        connection = self.dataflow_hook.get_pipelines_conn()
+        connection = copy.copy(dataflow_hook_template).get_pipelines_conn()
         mock_build.assert_called_once_with(
             "datapipelines", "v1", http=mock_authorize.return_value, cache_discovery=False
         )
         assert mock_build.return_value == connection
 
-    @mock.patch("airflow.providers.google.cloud.hooks.dataflow.DataflowHook.build_parent_name")
-    def test_build_parent_name(self, mock_build_parent_name):
-        """
-        Test that build_parent_name is called with the correct params and
-        returns the correct parent string
-        """
+    def test_build_parent_name(self):
+        """Test that build_parent_name returns the correct parent string"""
         result = self.dataflow_hook.build_parent_name(
             project_id=TEST_PROJECT,
             location=TEST_LOCATION,
         )
-        mock_build_parent_name.assert_called_with(
-            project_id=TEST_PROJECT,
-            location=TEST_LOCATION,
-        )
-        assert mock_build_parent_name.return_value == result
+        assert result == TEST_PIPELINE_PARENT
 
-    @mock.patch("airflow.providers.google.cloud.hooks.dataflow.DataflowHook.get_pipelines_conn")
-    def test_create_data_pipeline(self, mock_connection):
+    def test_create_data_pipeline(self):
         """
         Test that request are called with the correct params
         Test that request returns the correct value
         """
-        mock_locations = mock_connection.return_value.projects.return_value.locations
-        mock_request = mock_locations.return_value.pipelines.return_value.create
+        mock_request = self.mock_pipelines.create
         mock_request.return_value.execute.return_value = TEST_PIPELINE_BODY
 
         result = self.dataflow_hook.create_data_pipeline(
@@ -1425,13 +1124,12 @@ class TestDataflowPipelineHook:
         )
         assert result == TEST_PIPELINE_BODY
 
-    @mock.patch("airflow.providers.google.cloud.hooks.dataflow.DataflowHook.get_pipelines_conn")
-    def test_run_data_pipeline(self, mock_connection):
+    def test_run_data_pipeline(self):
         """
         Test that run_data_pipeline is called with correct parameters and
         calls Google Data Pipelines API
         """
-        mock_request = mock_connection.return_value.projects.return_value.locations.return_value.pipelines.return_value.run
+        mock_request = self.mock_pipelines.run
         mock_request.return_value.execute.return_value = {"job": {"id": TEST_JOB_ID}}
 
         result = self.dataflow_hook.run_data_pipeline(
@@ -1446,14 +1144,12 @@ class TestDataflowPipelineHook:
         )
         assert result == {"job": {"id": TEST_JOB_ID}}
 
-    @mock.patch("airflow.providers.google.cloud.hooks.dataflow.DataflowHook.get_pipelines_conn")
-    def test_get_data_pipeline(self, mock_connection):
+    def test_get_data_pipeline(self):
         """
         Test that get_data_pipeline is called with correct parameters and
         calls Google Data Pipelines API
         """
-        mock_locations = mock_connection.return_value.projects.return_value.locations
-        mock_request = mock_locations.return_value.pipelines.return_value.get
+        mock_request = self.mock_pipelines.get
         mock_request.return_value.execute.return_value = TEST_PIPELINE_BODY
 
         result = self.dataflow_hook.get_data_pipeline(
@@ -1467,14 +1163,12 @@ class TestDataflowPipelineHook:
         )
         assert result == TEST_PIPELINE_BODY
 
-    @mock.patch("airflow.providers.google.cloud.hooks.dataflow.DataflowHook.get_pipelines_conn")
-    def test_delete_data_pipeline(self, mock_connection):
+    def test_delete_data_pipeline(self):
         """
         Test that delete_data_pipeline is called with correct parameters and
         calls Google Data Pipelines API
         """
-        mock_locations = mock_connection.return_value.projects.return_value.locations
-        mock_request = mock_locations.return_value.pipelines.return_value.delete
+        mock_request = self.mock_pipelines.delete
         mock_request.return_value.execute.return_value = None
 
         result = self.dataflow_hook.delete_data_pipeline(
@@ -1595,9 +1289,16 @@ class TestDataflow:
             pytest.param(APACHE_BEAM_V_2_22_0_PYTHON_SDK_LOG, id="apache-beam-2.22.0-Python"),
         ],
     )
-    def test_data_flow_valid_job_id(self, log):
-        echos = ";".join(f"echo {shlex.quote(line)}" for line in log.splitlines())
-        cmd = ["bash", "-c", echos]
+    @mock.patch("subprocess.Popen")
+    @mock.patch("select.select")
+    def test_data_flow_valid_job_id(self, mock_select, mock_popen, log):
+        mock_proc = mock_popen.return_value
+        mock_proc.stdout = io.BytesIO(log.encode())
+        mock_proc.stderr = io.BytesIO()
+        mock_proc.poll.return_value = 0
+        mock_proc.returncode = 0
+        mock_select.return_value = ([mock_proc.stdout], None, None)
+        cmd = ["fake", "cmd"]
         found_job_id = None
 
         def callback(job_id):
@@ -1689,6 +1390,7 @@ def make_mock_awaitable():
     return func
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestAsyncDataflowHook:
     @pytest.fixture
     def hook(self):
@@ -1696,8 +1398,17 @@ class TestAsyncDataflowHook:
             gcp_conn_id=TEST_PROJECT_ID,
         )
 
-    @pytest.mark.asyncio
-    @mock.patch(DATAFLOW_STRING.format("AsyncDataflowHook.initialize_client"))
+    async def test_initialize_client_reuses_client(self, hook):
+        client_class = mock.Mock()
+        sync_hook = mock.Mock()
+        with mock.patch.object(hook, "get_sync_hook", new=mock.AsyncMock(return_value=sync_hook)):
+            first_client = await hook.initialize_client(client_class)
+            second_client = await hook.initialize_client(client_class)
+
+        assert first_client is second_client
+        client_class.assert_called_once_with(credentials=sync_hook.get_credentials.return_value)
+
+    @mock.patch(ASYNC_DATAFLOW_INITIALIZE_CLIENT)
     async def test_get_job(self, initialize_client_mock, hook, make_mock_awaitable):
         client = initialize_client_mock.return_value
         make_mock_awaitable(client.get_job, None)
@@ -1721,8 +1432,7 @@ class TestAsyncDataflowHook:
             request=request,
         )
 
-    @pytest.mark.asyncio
-    @mock.patch(DATAFLOW_STRING.format("AsyncDataflowHook.initialize_client"))
+    @mock.patch(ASYNC_DATAFLOW_INITIALIZE_CLIENT)
     async def test_list_jobs(self, initialize_client_mock, hook, make_mock_awaitable):
         client = initialize_client_mock.return_value
         make_mock_awaitable(client.get_job, None)
@@ -1745,8 +1455,7 @@ class TestAsyncDataflowHook:
         initialize_client_mock.assert_called_once()
         client.list_jobs.assert_called_once_with(request=request)
 
-    @pytest.mark.asyncio
-    @mock.patch(DATAFLOW_STRING.format("AsyncDataflowHook.initialize_client"))
+    @mock.patch(ASYNC_DATAFLOW_INITIALIZE_CLIENT)
     async def test_list_job_messages(self, initialize_client_mock, hook):
         client = initialize_client_mock.return_value
         await hook.list_job_messages(
@@ -1769,8 +1478,7 @@ class TestAsyncDataflowHook:
         initialize_client_mock.assert_called_once()
         client.list_job_messages.assert_called_once_with(request=request)
 
-    @pytest.mark.asyncio
-    @mock.patch(DATAFLOW_STRING.format("AsyncDataflowHook.initialize_client"))
+    @mock.patch(ASYNC_DATAFLOW_INITIALIZE_CLIENT)
     async def test_get_job_metrics(self, initialize_client_mock, hook):
         client = initialize_client_mock.return_value
         await hook.get_job_metrics(
@@ -445,6 +445,8 @@ class OracleHook(DbApiHook):
             columns = f"({', '.join(target_fields)})" if target_fields else ""
             value_placeholders = ", ".join(f":{i}" for i in range(1, len(values_base) + 1))
         prepared_stm = f"insert into {table} {columns} values ({value_placeholders})"
+        # The prepared statement is kept on the cursor across commits, so it only needs parsing once.
+        cursor.prepare(prepared_stm)
 
         row_count = 0
         # Chunk the rows
@@ -453,7 +455,6 @@ class OracleHook(DbApiHook):
             row_chunk.append(row)
             row_count += 1
             if row_count % commit_every == 0:
-                cursor.prepare(prepared_stm)
                 cursor.executemany(None, row_chunk)
                 conn.commit()
                 self.log.info("[%s] inserted %s rows", table, row_count)
@@ -461,7 +462,6 @@ class OracleHook(DbApiHook):
                 row_chunk = []
         # Commit the leftover chunk
         if row_chunk:
-            cursor.prepare(prepared_stm)
             cursor.executemany(None, row_chunk)
             conn.commit()
             self.log.info("[%s] inserted %s rows", table, row_count)
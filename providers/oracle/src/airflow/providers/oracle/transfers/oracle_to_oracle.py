@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from itertools import chain
 from typing import TYPE_CHECKING
 
 from airflow.providers.common.compat.sdk import BaseOperator
@@ -66,22 +67,28 @@ class OracleToOracleOperator(BaseOperator):
         self.rows_chunk = rows_chunk
 
     def _execute(self, src_hook, dest_hook, context) -> None:
-        with src_hook.get_conn() as src_conn:
-            cursor = src_conn.cursor()
+        with src_hook.get_conn() as src_conn, src_conn.cursor() as cursor:
+            # Fetch each chunk in a single round trip instead of the driver's default of 100 rows.
+            cursor.arraysize = self.rows_chunk
+            cursor.prefetchrows = self.rows_chunk + 1
             self.log.info("Querying data from source: %s", self.oracle_source_conn_id)
             cursor.execute(self.source_sql, self.source_sql_params)
             target_fields = [field[0] for field in cursor.description]
 
-            rows_total = 0
-            for rows in iter(lambda: cursor.fetchmany(self.rows_chunk), []):
-                dest_hook.bulk_insert_rows(
-                    self.destination_table, rows, target_fields=target_fields, commit_every=self.rows_chunk
-                )
-                rows_total += len(rows)
-                self.log.info("Total inserted: %s rows", rows_total)
+            first_chunk = cursor.fetchmany(self.rows_chunk)
+            if not first_chunk:
+                self.log.info("Source query returned no rows, nothing to transfer.")
+                return
+
+            # Stream every chunk through a single bulk insert, so the destination connection and the
+            # INSERT statement are set up once for the whole transfer and committed every rows_chunk rows.
+            chunks = chain([first_chunk], iter(lambda: cursor.fetchmany(self.rows_chunk), []))
+            rows = chain.from_iterable(chunks)
+            dest_hook.bulk_insert_rows(
+                self.destination_table, rows, target_fields=target_fields, commit_every=self.rows_chunk
+            )
 
             self.log.info("Finished data transfer.")
-            cursor.close()
 
     def execute(self, context: Context) -> None:
         src_hook = OracleHook(oracle_conn_id=self.oracle_source_conn_id)
@@ -475,11 +475,7 @@ class TestOracleHook:
         rows = [(1, 2, 3), (4, 5, 6), (7, 8, 9)]
         target_fields = ["col1", "col2", "col3"]
         self.db_hook.bulk_insert_rows("table", rows, target_fields, commit_every=2)
-        calls = [
-            mock.call("insert into table (col1, col2, col3) values (:1, :2, :3)"),
-            mock.call("insert into table (col1, col2, col3) values (:1, :2, :3)"),
-        ]
-        self.cur.prepare.assert_has_calls(calls)
+        self.cur.prepare.assert_called_once_with("insert into table (col1, col2, col3) values (:1, :2, :3)")
         calls = [
             mock.call(None, rows[:2]),
             mock.call(None, rows[2:]),
@@ -35,14 +35,19 @@ class TestOracleToOracleTransfer:
             ("id", "<class 'oracledb.NUMBER'>", 39, None, 38, 0, 0),
             ("description", "<class 'oracledb.STRING'>", 60, 240, None, None, 1),
         ]
-        cursor_rows = [[1, "description 1"], [2, "description 2"]]
+        cursor_chunks = [
+            [[1, "description 1"], [2, "description 2"]],
+            [[3, "description 3"]],
+        ]
 
+        inserted_rows = []
         mock_dest_hook = MagicMock()
+        mock_dest_hook.bulk_insert_rows.side_effect = lambda table, rows, **kwargs: inserted_rows.extend(rows)
         mock_src_hook = MagicMock()
         mock_src_conn = mock_src_hook.get_conn.return_value.__enter__.return_value
-        mock_cursor = mock_src_conn.cursor.return_value
+        mock_cursor = mock_src_conn.cursor.return_value.__enter__.return_value
         mock_cursor.description.__iter__.return_value = cursor_description
-        mock_cursor.fetchmany.side_effect = [cursor_rows, []]
+        mock_cursor.fetchmany.side_effect = [*cursor_chunks, []]
 
         op = OracleToOracleOperator(
             task_id="copy_data",
@@ -58,13 +63,36 @@ class TestOracleToOracleTransfer:
 
         assert mock_src_hook.get_conn.called
         assert mock_src_conn.cursor.called
+        assert mock_src_conn.cursor.return_value.__exit__.called
+        assert mock_cursor.arraysize == rows_chunk
+        assert mock_cursor.prefetchrows == rows_chunk + 1
         mock_cursor.execute.assert_called_once_with(source_sql, source_sql_params)
 
-        calls = [
-            mock.call(rows_chunk),
-            mock.call(rows_chunk),
-        ]
-        mock_cursor.fetchmany.assert_has_calls(calls)
+        mock_cursor.fetchmany.assert_has_calls([mock.call(rows_chunk)] * 3)
         mock_dest_hook.bulk_insert_rows.assert_called_once_with(
-            destination_table, cursor_rows, commit_every=rows_chunk, target_fields=["id", "description"]
+            destination_table, mock.ANY, commit_every=rows_chunk, target_fields=["id", "description"]
         )
+        assert inserted_rows == [*cursor_chunks[0], *cursor_chunks[1]]
+
+    def test_execute_empty_source(self):
+        mock_dest_hook = MagicMock()
+        mock_src_hook = MagicMock()
+        mock_src_conn = mock_src_hook.get_conn.return_value.__enter__.return_value
+        mock_cursor = mock_src_conn.cursor.return_value.__enter__.return_value
+        mock_cursor.description.__iter__.return_value = [
+            ("id", "<class 'oracledb.NUMBER'>", 39, None, 38, 0, 0),
+        ]
+        mock_cursor.fetchmany.side_effect = [[]]
+
+        op = OracleToOracleOperator(
+            task_id="copy_data",
+            oracle_destination_conn_id="oracle_destination_conn_id",
+            destination_table="destination_table",
+            oracle_source_conn_id="oracle_source_conn_id",
+            source_sql="select id from source_table",
+        )
+
+        op._execute(mock_src_hook, mock_dest_hook, None)
+
+        mock_cursor.fetchmany.assert_called_once_with(5000)
+        mock_dest_hook.bulk_insert_rows.assert_not_called()